@@ -4,137 +4,307 @@ Klipper Log Analyzer Tool
 A comprehensive tool to analyze Klipper 3D printer logs and provide insights.
 """
 
+import io
+import os
 import re
+import math
 import json
+import mmap
 import argparse
 import matplotlib.pyplot as plt
 import pandas as pd
 from datetime import datetime, timedelta
 from collections import defaultdict, Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from typing import Dict, List, Tuple, Any
 import statistics
 import seaborn as sns
 
+# Line prefixes handled by _parse_mcu_info
+_MCU_PREFIXES = (b'Loaded MCU', b'MCU ', b'Configured MCU')
+
+# Pre-compiled patterns for the per-line parsers
+_MCU_LOAD_RE = re.compile(r"Loaded MCU '(\w+)' (\d+) commands \((.*?)\)")
+_MCU_CONFIG_RE = re.compile(r"MCU '(\w+)' config: (.*)")
+_MCU_CONFIGURED_RE = re.compile(r"Configured MCU '(\w+)' \((\d+) moves\)")
+_STATS_RE = re.compile(r"Stats (\d+\.?\d*): (.*)")
+# Stats patterns start with \b so a scan only tries to match at word
+# starts instead of re-backtracking through every suffix of each key
+_KV_RE = re.compile(r'\b(\w+)=(?:(-?\d+(?:\.\d+)?)|(\w+))')
+_SENSOR_RE = re.compile(r'\b(\w+): ')
+_SENSOR_FIELD_RE = re.compile(r'\b(temp|target|pwm)=([0-9.-]+)')
+# Words float() accepts; they land in the word group but are still numbers
+_FLOAT_WORDS = frozenset(('nan', 'inf', 'infinity'))
+_CONFIG_SECTION_RE = re.compile(r'\[([^\]]+)\]$')
+
+# Keywords that mark a line as an error/warning, in priority order
+_ERROR_TOKENS = (b'error', b'warning', b'exception', b'failed')
+
+
+def _decode(line: bytes) -> str:
+    """Decode a raw log line, dropping any invalid UTF-8 sequences."""
+    return line.decode('utf-8', errors='ignore')
+
+
+def _pad_column(column: List[Any], length: int):
+    """Extend a stats column with NaN up to the given number of rows."""
+    if len(column) < length:
+        column.extend([math.nan] * (length - len(column)))
+
+
+# Records below declare __slots__ by hand (rather than dataclass(slots=True))
+# to stay compatible with Python 3.7
+
+@dataclass
+class ErrorEntry:
+    """An error or warning line found in the log."""
+    __slots__ = ('line_number', 'type', 'message')
+    line_number: int
+    type: str
+    message: str
+
+
+@dataclass
+class TimelineEvent:
+    """A notable event in the log, such as an MCU being loaded."""
+    __slots__ = ('line', 'type', 'mcu', 'message')
+    line: int
+    type: str
+    mcu: str
+    message: str
+
+
 class KlipperLogAnalyzer:
+    __slots__ = (
+        'log_file_path', 'stats_columns', 'stats_count', '_text_columns',
+        'mcu_configs', 'errors', 'config_sections', 'timeline',
+        'stats_line_offsets', '_df', '_column_classes'
+    )
+    
     def __init__(self, log_file_path: str):
         self.log_file_path = log_file_path
-        self.stats_data = []
+        # Stats rows are stored column-wise; stats_count is the row count
+        self.stats_columns = defaultdict(list)
+        self.stats_count = 0
+        self._text_columns = set()
         self.mcu_configs = {}
         self.errors = []
         self.config_sections = {}
         self.timeline = []
-        self.performance_metrics = defaultdict(list)
-        
-    def parse_log(self):
-        """Parse the entire log file and extract different types of information."""
+        # (line_number, byte offset) of every stats line, filled by parse_log
+        self.stats_line_offsets = None
+        self._df = None
+        # Sensor columns grouped by suffix ('temp', 'target', 'pwm'), set by _get_df
+        self._column_classes = None
+        
+    def parse_log(self, jobs: int = 1):
+        """Parse the entire log file and extract different types of information.
+        
+        With jobs > 1 the file is split into newline-aligned byte ranges
+        that are parsed in separate processes and merged in file order.
+        """
         print(f"📊 Analyzing Klipper log: {self.log_file_path}")
         
-        with open(self.log_file_path, 'r', encoding='utf-8', errors='ignore') as file:
-            current_config_section = None
-            line_number = 0
-            
-            for line in file:
-                line_number += 1
-                line = line.strip()
-                
-                if not line:
-                    continue
-                
-                # Parse different types of log entries
-                self._parse_mcu_info(line, line_number)
-                self._parse_stats_line(line, line_number)
-                self._parse_config_section(line, line_number)
-                self._parse_errors_warnings(line, line_number)
-                
+        self.stats_line_offsets = []
+        if jobs > 1:
+            line_number = self._parse_parallel(jobs)
+        else:
+            with self._map_log() as mm:
+                line_number = self._parse_buffer(mm)
+        self._df = None
+        self._column_classes = None
+        
         print(f"✅ Parsed {line_number} lines")
-        print(f"📈 Found {len(self.stats_data)} stats entries")
+        print(f"📈 Found {self.stats_count} stats entries")
         print(f"🔧 Found {len(self.mcu_configs)} MCU configurations")
         print(f"⚠️  Found {len(self.errors)} errors/warnings")
         
-    def _parse_mcu_info(self, line: str, line_number: int):
-        """Parse MCU loading and configuration information."""
+    @contextmanager
+    def _map_log(self):
+        """Map the log file read-only for the duration of the context."""
+        with open(self.log_file_path, 'rb') as file:
+            # mmap refuses zero-length files; an empty buffer reads the same
+            if os.fstat(file.fileno()).st_size == 0:
+                yield io.BytesIO()
+                return
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                yield mm
+    
+    def _parse_parallel(self, jobs: int) -> int:
+        """Parse the log across worker processes and return the number of lines."""
+        size = os.path.getsize(self.log_file_path)
+        bounds = [0]
+        with open(self.log_file_path, 'rb') as file:
+            # Move each split point forward to the start of the next line
+            for k in range(1, jobs):
+                file.seek(max(size * k // jobs, bounds[-1]))
+                file.readline()
+                bounds.append(file.tell())
+        bounds.append(size)
+        
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            chunks = pool.map(_parse_chunk, repeat(self.log_file_path), bounds[:-1], bounds[1:])
+            line_number = 0
+            for line_count, chunk in chunks:
+                self._merge_chunk(chunk, line_number)
+                line_number += line_count
+        return line_number
+    
+    def _merge_chunk(self, chunk: 'KlipperLogAnalyzer', line_offset: int):
+        """Append the results of a parsed chunk, shifting its line numbers."""
+        for key, column in chunk.stats_columns.items():
+            _pad_column(column, chunk.stats_count)
+            if key == 'line_number':
+                column = [n + line_offset for n in column]
+            merged = self.stats_columns[key]
+            _pad_column(merged, self.stats_count)
+            merged.extend(column)
+        self.stats_count += chunk.stats_count
+        self._text_columns |= chunk._text_columns
+        
+        self.stats_line_offsets.extend(
+            (n + line_offset, offset) for n, offset in chunk.stats_line_offsets
+        )
+        
+        # MCU lines depend on earlier ones (config needs the load line), so
+        # they are replayed here in file order rather than parsed in workers
+        for line, line_number in chunk.mcu_lines:
+            self._parse_mcu_info(line, line_number + line_offset)
+        
+        for section_name, section in chunk.config_sections.items():
+            section['line_number'] += line_offset
+            self.config_sections[section_name] = section
+        
+        for error in chunk.errors:
+            error.line_number += line_offset
+            self.errors.append(error)
+    
+    def _parse_buffer(self, buffer: mmap.mmap, start: int = 0, end: int = None) -> int:
+        """Parse the lines of a mapped log between two byte offsets.
+        
+        Returns the number of lines read; end=None reads to the end of the buffer.
+        """
+        line_number = 0
+        offset = start
+        buffer.seek(start)
+        
+        # Lines stay as bytes until a parser needs them, which avoids
+        # decoding the bulk of the log that never matches anything
+        while end is None or offset < end:
+            line = buffer.readline()
+            if not line:
+                break
+            line_number += 1
+            line_offset = offset
+            offset += len(line)
+            line = line.strip()
+            
+            if not line:
+                continue
+            
+            # Dispatch on the line prefix so only the matching parser runs
+            if line.startswith(b'Stats '):
+                self.stats_line_offsets.append((line_number, line_offset))
+                self._parse_stats_line(_decode(line), line_number)
+            elif line.startswith(_MCU_PREFIXES):
+                # Lines such as "MCU error during connect" share the prefix
+                # but are not MCU info, so they still get the error scan
+                if not self._parse_mcu_info(_decode(line), line_number):
+                    self._parse_errors_warnings(line, line_number)
+            elif line[:1] == b'[':
+                if self._parse_config_section(_decode(line), line_number) is None:
+                    self._parse_errors_warnings(line, line_number)
+            else:
+                self._parse_errors_warnings(line, line_number)
+        
+        return line_number
+    
+    def _parse_mcu_info(self, line: str, line_number: int) -> bool:
+        """Parse MCU loading and configuration information.
+        
+        Returns False if the line is not one of the known MCU messages.
+        """
+        # Each pattern has its own literal prefix, so check that first and
+        # run only the one regex that can match.
         # MCU loading pattern
-        mcu_load_pattern = r"Loaded MCU '(\w+)' (\d+) commands \((.*?)\)"
-        match = re.match(mcu_load_pattern, line)
-        if match:
-            mcu_name, commands, version_info = match.groups()
-            self.mcu_configs[mcu_name] = {
-                'commands': int(commands),
-                'version_info': version_info,
-                'line_number': line_number
-            }
-            self.timeline.append({
-                'line': line_number,
-                'type': 'mcu_load',
-                'mcu': mcu_name,
-                'message': line
-            })
+        if line.startswith('Loaded MCU'):
+            match = _MCU_LOAD_RE.match(line)
+            if match:
+                mcu_name, commands, version_info = match.groups()
+                self.mcu_configs[mcu_name] = {
+                    'commands': int(commands),
+                    'version_info': version_info,
+                    'line_number': line_number
+                }
+                self.timeline.append(TimelineEvent(line_number, 'mcu_load', mcu_name, line))
+                return True
         
         # MCU configuration pattern
-        mcu_config_pattern = r"MCU '(\w+)' config: (.*)"
-        match = re.match(mcu_config_pattern, line)
-        if match:
-            mcu_name, config_data = match.groups()
-            if mcu_name in self.mcu_configs:
-                self.mcu_configs[mcu_name]['config'] = config_data
+        elif line.startswith('MCU '):
+            match = _MCU_CONFIG_RE.match(line)
+            if match:
+                mcu_name, config_data = match.groups()
+                if mcu_name in self.mcu_configs:
+                    self.mcu_configs[mcu_name]['config'] = config_data
+                return True
         
         # MCU configured pattern
-        mcu_configured_pattern = r"Configured MCU '(\w+)' \((\d+) moves\)"
-        match = re.match(mcu_configured_pattern, line)
-        if match:
-            mcu_name, moves = match.groups()
-            if mcu_name in self.mcu_configs:
-                self.mcu_configs[mcu_name]['moves'] = int(moves)
+        elif line.startswith('Configured MCU'):
+            match = _MCU_CONFIGURED_RE.match(line)
+            if match:
+                mcu_name, moves = match.groups()
+                if mcu_name in self.mcu_configs:
+                    self.mcu_configs[mcu_name]['moves'] = int(moves)
+                return True
+        
+        return False
     
     def _parse_stats_line(self, line: str, line_number: int):
         """Parse statistics lines for performance metrics."""
-        stats_pattern = r"Stats (\d+\.?\d*): (.*)"
-        match = re.match(stats_pattern, line)
+        match = _STATS_RE.match(line)
         if match:
             timestamp, stats_content = match.groups()
-            timestamp = float(timestamp)
             
-            # Parse the stats content
+            # Parse the stats content. Numbers are kept as the captured
+            # strings and converted a whole column at a time in _get_df
             stats_dict = {'timestamp': timestamp, 'line_number': line_number}
             
             # Extract key-value pairs from stats
-            kv_pattern = r'(\w+)=([0-9.-]+|active|inactive|\w+)'
-            for key, value in re.findall(kv_pattern, stats_content):
-                try:
-                    # Try to convert to float if it's a number
-                    if value not in ['active', 'inactive']:
-                        stats_dict[key] = float(value)
-                    else:
-                        stats_dict[key] = value
-                except ValueError:
-                    stats_dict[key] = value
-            
-            # Extract temperature data
-            temp_pattern = r'(\w+): temp=([0-9.-]+)'
-            for sensor, temp in re.findall(temp_pattern, stats_content):
-                stats_dict[f'{sensor}_temp'] = float(temp)
-            
-            # Extract target temperatures
-            target_pattern = r'(\w+): target=([0-9.-]+)'
-            for sensor, target in re.findall(target_pattern, stats_content):
-                stats_dict[f'{sensor}_target'] = float(target)
-            
-            # Extract PWM values
-            pwm_pattern = r'(\w+): .*?pwm=([0-9.-]+)'
-            for sensor, pwm in re.findall(pwm_pattern, stats_content):
-                stats_dict[f'{sensor}_pwm'] = float(pwm)
+            # The regex captures numbers and words in separate groups, so
+            # keys that ever carry a word can be kept out of the conversion
+            for key, number, word in _KV_RE.findall(stats_content):
+                if number:
+                    stats_dict[key] = number
+                else:
+                    stats_dict[key] = word
+                    if word.lower() not in _FLOAT_WORDS:
+                        self._text_columns.add(key)
             
-            self.stats_data.append(stats_dict)
+            # Extract temperature, target and PWM values from each
+            # "sensor: ..." section; split() yields [prefix, name, body, ...]
+            sections = _SENSOR_RE.split(stats_content)
+            for sensor, section in zip(sections[1::2], sections[2::2]):
+                for field, value in _SENSOR_FIELD_RE.findall(section):
+                    stats_dict[f'{sensor}_{field}'] = value
             
-            # Track performance metrics
-            for key in ['freq', 'sysload', 'cputime', 'memavail']:
-                if key in stats_dict:
-                    self.performance_metrics[key].append(stats_dict[key])
+            self._append_stats_row(stats_dict)
+    
+    def _append_stats_row(self, stats_dict: Dict[str, Any]):
+        """Append one parsed stats line to the column store."""
+        row_index = self.stats_count
+        for key, value in stats_dict.items():
+            column = self.stats_columns[key]
+            # Pad columns that were missing from the previous rows
+            _pad_column(column, row_index)
+            column.append(value)
+        self.stats_count = row_index + 1
     
     def _parse_config_section(self, line: str, line_number: int):
         """Parse configuration sections from the log."""
-        config_section_pattern = r'^\[([^\]]+)\]$'
-        match = re.match(config_section_pattern, line)
+        match = _CONFIG_SECTION_RE.match(line)
         if match:
             section_name = match.group(1)
             self.config_sections[section_name] = {
@@ -144,34 +314,47 @@ class KlipperLogAnalyzer:
             return section_name
         return None
     
-    def _parse_errors_warnings(self, line: str, line_number: int):
+    def _parse_errors_warnings(self, line: bytes, line_number: int):
         """Parse error and warning messages."""
-        error_patterns = [
-            r'error',
-            r'warning',
-            r'exception',
-            r'failed',
-            r'ERROR',
-            r'WARNING',
-            r'EXCEPTION',
-            r'FAILED'
-        ]
-        
-        for pattern in error_patterns:
-            if re.search(pattern, line, re.IGNORECASE):
-                self.errors.append({
-                    'line_number': line_number,
-                    'type': pattern.lower(),
-                    'message': line
-                })
+        # Plain substring checks on the lowercased line are far cheaper
+        # than a case-insensitive regex search
+        lowered = line.lower()
+        for token in _ERROR_TOKENS:
+            if token in lowered:
+                self.errors.append(ErrorEntry(line_number, token.decode(), _decode(line)))
                 break
     
+    def _get_df(self) -> pd.DataFrame:
+        """Return the stats DataFrame, building it on first use."""
+        if self._df is None:
+            data = {}
+            for key, column in self.stats_columns.items():
+                _pad_column(column, self.stats_count)
+                # Convert each numeric string column in one vectorized pass;
+                # line_number is the only column stored as int already
+                if key in self._text_columns or key == 'line_number':
+                    data[key] = column
+                else:
+                    data[key] = pd.to_numeric(column, errors='coerce').astype('float64', copy=False)
+            # The column set and row count are already known from parsing,
+            # so hand them to pandas instead of having it derive them
+            self._df = pd.DataFrame(data,
+                                    index=pd.RangeIndex(self.stats_count),
+                                    columns=list(self.stats_columns))
+            # Classify the sensor columns once for all the report methods
+            columns = self._df.columns
+            self._column_classes = {
+                suffix: columns[columns.str.endswith(f'_{suffix}')].tolist()
+                for suffix in ('temp', 'target', 'pwm')
+            }
+        return self._df
+    
     def generate_performance_report(self) -> Dict[str, Any]:
         """Generate a comprehensive performance report."""
-        if not self.stats_data:
+        if not self.stats_count:
             return {"error": "No statistics data found in log"}
         
-        df = pd.DataFrame(self.stats_data)
+        df = self._get_df()
         
         report = {
             'summary': {
@@ -185,40 +368,59 @@ class KlipperLogAnalyzer:
             'communication_stats': {}
         }
         
-        # Performance metrics analysis
-        for metric in ['freq', 'sysload', 'cputime', 'memavail']:
-            if metric in df.columns:
-                values = df[metric].dropna()
-                if len(values) > 0:
+        # Performance metrics analysis, reduced in a single agg() call
+        metrics = [m for m in ['freq', 'sysload', 'cputime', 'memavail'] if m in df.columns]
+        if metrics:
+            metric_stats = df[metrics].agg(['mean', 'min', 'max', 'std', 'count'])
+            for metric in metrics:
+                stats = metric_stats[metric]
+                if stats['count'] > 0:
+                    values = df[metric]
+                    first = values.loc[values.first_valid_index()]
+                    last = values.loc[values.last_valid_index()]
                     report['performance_metrics'][metric] = {
-                        'mean': float(values.mean()),
-                        'min': float(values.min()),
-                        'max': float(values.max()),
-                        'std': float(values.std()) if len(values) > 1 else 0,
-                        'trend': 'increasing' if values.iloc[-1] > values.iloc[0] else 'decreasing' if len(values) > 1 else 'stable'
+                        'mean': float(stats['mean']),
+                        'min': float(stats['min']),
+                        'max': float(stats['max']),
+                        'std': float(stats['std']) if stats['count'] > 1 else 0,
+                        'trend': 'increasing' if last > first else 'decreasing' if stats['count'] > 1 else 'stable'
                     }
         
         # Temperature analysis
-        temp_columns = [col for col in df.columns if col.endswith('_temp')]
-        for temp_col in temp_columns:
-            sensor_name = temp_col.replace('_temp', '')
-            temps = df[temp_col].dropna()
-            if len(temps) > 0:
-                report['temperature_analysis'][sensor_name] = {
-                    'min_temp': float(temps.min()),
-                    'max_temp': float(temps.max()),
-                    'avg_temp': float(temps.mean()),
-                    'temp_stability': float(temps.std()) if len(temps) > 1 else 0
-                }
+        temp_columns = self._column_classes['temp']
+        if temp_columns:
+            temp_stats = df[temp_columns].agg(['min', 'max', 'mean', 'std', 'count'])
+            for temp_col in temp_columns:
+                sensor_name = temp_col.replace('_temp', '')
+                stats = temp_stats[temp_col]
+                if stats['count'] > 0:
+                    report['temperature_analysis'][sensor_name] = {
+                        'min_temp': float(stats['min']),
+                        'max_temp': float(stats['max']),
+                        'avg_temp': float(stats['mean']),
+                        'temp_stability': float(stats['std']) if stats['count'] > 1 else 0
+                    }
         
-        # MCU communication analysis
-        for mcu_prefix in ['mcu', 'EBBCan']:
-            mcu_keys = [col for col in df.columns if col.startswith(f'{mcu_prefix}_') or col.startswith(f'canstat_{mcu_prefix}')]
+        # MCU communication analysis; bucket the columns per MCU in a
+        # single pass over the column index
+        mcu_prefixes = {
+            'mcu': ('mcu_', 'canstat_mcu'),
+            'EBBCan': ('EBBCan_', 'canstat_EBBCan')
+        }
+        mcu_columns = {mcu_prefix: [] for mcu_prefix in mcu_prefixes}
+        for col in df.columns:
+            for mcu_prefix, prefixes in mcu_prefixes.items():
+                if col.startswith(prefixes):
+                    mcu_columns[mcu_prefix].append(col)
+                    break
+        
+        for mcu_prefix, mcu_keys in mcu_columns.items():
             if mcu_keys:
                 mcu_data = {}
                 for key in mcu_keys:
-                    values = df[key].dropna()
-                    if len(values) > 0 and values.dtype in ['float64', 'int64']:
+                    # pandas reductions skip NaN, so no dropna() copy is needed
+                    values = df[key]
+                    if values.dtype in ['float64', 'int64'] and values.count() > 0:
                         mcu_data[key] = {
                             'mean': float(values.mean()),
                             'max': float(values.max()),
@@ -228,13 +430,21 @@ class KlipperLogAnalyzer:
         
         return report
     
+    @staticmethod
+    def _downsample(df: pd.DataFrame, max_points: int = 4000) -> pd.DataFrame:
+        """Return every n-th row of df so that at most ~max_points remain."""
+        step = max(1, len(df) // max_points)
+        return df.iloc[::step]
+    
     def create_visualizations(self, output_dir: str = '.'):
         """Create various visualizations from the log data."""
-        if not self.stats_data:
+        if not self.stats_count:
             print("❌ No stats data available for visualization")
             return
         
-        df = pd.DataFrame(self.stats_data)
+        # Plots can't show more points than they have pixels, so thin out
+        # long logs before handing them to matplotlib
+        df = self._downsample(self._get_df())
         
         # Set up the plotting style
         plt.style.use('seaborn-v0_8' if 'seaborn-v0_8' in plt.style.available else 'default')
@@ -258,7 +468,7 @@ class KlipperLogAnalyzer:
         plt.close()
         
         # 2. Temperature monitoring
-        temp_columns = [col for col in df.columns if col.endswith('_temp')]
+        temp_columns = self._column_classes['temp']
         if temp_columns:
             plt.figure(figsize=(12, 6))
             for temp_col in temp_columns:
@@ -303,23 +513,36 @@ class KlipperLogAnalyzer:
     
     def extract_stats_to_file(self, output_file: str):
         """Extract all stats lines to a separate file."""
-        stats_lines = []
-        
-        with open(self.log_file_path, 'r', encoding='utf-8', errors='ignore') as file:
-            for line_number, line in enumerate(file, 1):
-                if line.strip().startswith('Stats '):
-                    stats_lines.append(f"Line {line_number}: {line.strip()}")
-        
-        with open(output_file, 'w') as f:
-            f.write(f"# Klipper Stats Lines Extracted from {self.log_file_path}\n")
-            f.write(f"# Total stats lines found: {len(stats_lines)}\n")
-            f.write(f"# Extracted on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+        with self._map_log() as mm:
+            # Reuse the offsets recorded by parse_log, otherwise locate the
+            # stats lines with a prefix-only scan
+            offsets = self.stats_line_offsets
+            if offsets is None:
+                offsets = self._find_stats_lines(mm)
             
-            for stats_line in stats_lines:
-                f.write(stats_line + '\n')
+            with open(output_file, 'w') as f:
+                f.write(f"# Klipper Stats Lines Extracted from {self.log_file_path}\n")
+                f.write(f"# Total stats lines found: {len(offsets)}\n")
+                f.write(f"# Extracted on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+                
+                # Stream each line straight from the mapped log
+                for line_number, offset in offsets:
+                    mm.seek(offset)
+                    f.write(f"Line {line_number}: {_decode(mm.readline().strip())}\n")
         
-        print(f"📤 Extracted {len(stats_lines)} stats lines to {output_file}")
-        return len(stats_lines)
+        print(f"📤 Extracted {len(offsets)} stats lines to {output_file}")
+        return len(offsets)
+    
+    @staticmethod
+    def _find_stats_lines(buffer: mmap.mmap) -> List[Tuple[int, int]]:
+        """Return (line_number, byte offset) for every stats line in the buffer."""
+        offsets = []
+        offset = 0
+        for line_number, line in enumerate(iter(buffer.readline, b''), 1):
+            if line.strip().startswith(b'Stats '):
+                offsets.append((line_number, offset))
+            offset += len(line)
+        return offsets
     
     def generate_health_report(self) -> str:
         """Generate a comprehensive health report."""
@@ -335,26 +558,36 @@ class KlipperLogAnalyzer:
             report_lines.append(f"    - Moves: {mcu_info.get('moves', 'N/A')}")
             report_lines.append(f"    - Version: {mcu_info.get('version_info', 'N/A')[:50]}...")
         
+        # Reduce every column the report needs in a single agg() call and
+        # read the results from a plain dict below
+        stats = {}
+        temp_columns = []
+        if self.stats_count:
+            df = self._get_df()
+            temp_columns = self._column_classes['temp']
+            summary_columns = [col for col in ['timestamp', 'sysload', 'memavail', 'rx_error', 'tx_error'] if col in df.columns]
+            stats = df[summary_columns + temp_columns].agg(['mean', 'max', 'min', 'count']).to_dict()
+        
         # Performance Summary
-        if self.stats_data:
-            df = pd.DataFrame(self.stats_data)
+        if self.stats_count:
+            runtime = stats['timestamp']['max'] - stats['timestamp']['min']
             report_lines.append(f"\n📊 PERFORMANCE SUMMARY:")
-            report_lines.append(f"  • Runtime: {df['timestamp'].max() - df['timestamp'].min():.1f} seconds")
-            report_lines.append(f"  • Stats frequency: {len(df) / (df['timestamp'].max() - df['timestamp'].min()):.2f} Hz")
+            report_lines.append(f"  • Runtime: {runtime:.1f} seconds")
+            report_lines.append(f"  • Stats frequency: {self.stats_count / runtime if runtime > 0 else 0:.2f} Hz")
             
             # System load analysis
-            if 'sysload' in df.columns:
-                avg_load = df['sysload'].mean()
-                max_load = df['sysload'].max()
+            if 'sysload' in stats:
+                avg_load = stats['sysload']['mean']
+                max_load = stats['sysload']['max']
                 report_lines.append(f"  • System load: avg={avg_load:.2f}, max={max_load:.2f}")
                 
                 if max_load > 1.0:
                     report_lines.append("    ⚠️  High system load detected!")
             
             # Memory analysis
-            if 'memavail' in df.columns:
-                min_mem = df['memavail'].min()
-                avg_mem = df['memavail'].mean()
+            if 'memavail' in stats:
+                min_mem = stats['memavail']['min']
+                avg_mem = stats['memavail']['mean']
                 report_lines.append(f"  • Memory: min={min_mem/1024:.1f}MB, avg={avg_mem/1024:.1f}MB")
                 
                 if min_mem < 100000:  # Less than 100MB
@@ -363,24 +596,24 @@ class KlipperLogAnalyzer:
         # Error Analysis
         report_lines.append(f"\n⚠️  ERROR ANALYSIS:")
         if self.errors:
-            error_types = Counter([error['type'] for error in self.errors])
+            error_types = Counter([error.type for error in self.errors])
             for error_type, count in error_types.items():
                 report_lines.append(f"  • {error_type}: {count} occurrences")
             
             report_lines.append(f"\n📝 Recent errors:")
             for error in self.errors[-5:]:  # Last 5 errors
-                report_lines.append(f"  Line {error['line_number']}: {error['message'][:80]}...")
+                report_lines.append(f"  Line {error.line_number}: {error.message[:80]}...")
         else:
             report_lines.append("  ✅ No errors detected!")
         
         # Communication Health
-        if self.stats_data:
-            df = pd.DataFrame(self.stats_data)
+        total_rx_errors = 0
+        if self.stats_count:
             report_lines.append(f"\n📡 COMMUNICATION HEALTH:")
             
-            if 'rx_error' in df.columns:
-                total_rx_errors = df['rx_error'].max() - df['rx_error'].min()
-                total_tx_errors = df['tx_error'].max() - df['tx_error'].min() if 'tx_error' in df.columns else 0
+            if 'rx_error' in stats:
+                total_rx_errors = stats['rx_error']['max'] - stats['rx_error']['min']
+                total_tx_errors = stats['tx_error']['max'] - stats['tx_error']['min'] if 'tx_error' in stats else 0
                 report_lines.append(f"  • RX errors: {total_rx_errors}")
                 report_lines.append(f"  • TX errors: {total_tx_errors}")
                 
@@ -390,16 +623,15 @@ class KlipperLogAnalyzer:
                     report_lines.append("    ✅ No communication errors!")
         
         # Temperature Health
-        temp_columns = [col for col in df.columns if col.endswith('_temp')] if self.stats_data else []
         if temp_columns:
             report_lines.append(f"\n🌡️  TEMPERATURE ANALYSIS:")
             for temp_col in temp_columns:
                 sensor_name = temp_col.replace('_temp', '')
-                temps = df[temp_col].dropna()
-                if len(temps) > 0:
-                    min_temp = temps.min()
-                    max_temp = temps.max()
-                    avg_temp = temps.mean()
+                temps = stats[temp_col]
+                if temps['count'] > 0:
+                    min_temp = temps['min']
+                    max_temp = temps['max']
+                    avg_temp = temps['mean']
                     report_lines.append(f"  • {sensor_name}: min={min_temp:.1f}°C, max={max_temp:.1f}°C, avg={avg_temp:.1f}°C")
                     
                     # Temperature warnings
@@ -412,20 +644,18 @@ class KlipperLogAnalyzer:
         
         # Generate recommendations based on analysis
         recommendations = []
-        if self.stats_data:
-            df = pd.DataFrame(self.stats_data)
-            
-            if 'sysload' in df.columns and df['sysload'].mean() > 0.8:
+        if self.stats_count:
+            if 'sysload' in stats and stats['sysload']['mean'] > 0.8:
                 recommendations.append("Consider reducing print complexity or upgrading hardware")
             
-            if 'memavail' in df.columns and df['memavail'].min() < 200000:
+            if 'memavail' in stats and stats['memavail']['min'] < 200000:
                 recommendations.append("Monitor memory usage - consider closing unnecessary processes")
             
             if len(self.errors) > 10:
                 recommendations.append("High error count detected - review printer configuration")
             
             # Communication recommendations
-            if 'rx_error' in df.columns and (df['rx_error'].max() - df['rx_error'].min()) > 5:
+            if total_rx_errors > 5:
                 recommendations.append("Communication errors detected - check cables and connections")
         
         if not recommendations:
@@ -441,8 +671,8 @@ class KlipperLogAnalyzer:
     def export_data(self, output_dir: str = '.'):
         """Export analyzed data to various formats."""
         # Export stats data to CSV
-        if self.stats_data:
-            df = pd.DataFrame(self.stats_data)
+        if self.stats_count:
+            df = self._get_df()
             df.to_csv(f'{output_dir}/klipper_stats_data.csv', index=False)
             print(f"📊 Stats data exported to {output_dir}/klipper_stats_data.csv")
         
@@ -453,10 +683,37 @@ class KlipperLogAnalyzer:
         
         # Export errors to JSON
         with open(f'{output_dir}/klipper_errors.json', 'w') as f:
-            json.dump(self.errors, f, indent=2)
+            json.dump([asdict(error) for error in self.errors], f, indent=2)
         print(f"⚠️  Errors exported to {output_dir}/klipper_errors.json")
 
 
+class _ChunkParser(KlipperLogAnalyzer):
+    """Analyzer used by worker processes to parse one byte range of a log."""
+    __slots__ = ('mcu_lines',)
+    
+    def __init__(self, log_file_path: str):
+        super().__init__(log_file_path)
+        self.stats_line_offsets = []
+        self.mcu_lines = []
+    
+    def _parse_mcu_info(self, line: str, line_number: int) -> bool:
+        # Applying MCU lines is deferred to the parent, see
+        # KlipperLogAnalyzer._merge_chunk; only report whether one matched
+        if not (_MCU_LOAD_RE.match(line) or _MCU_CONFIG_RE.match(line)
+                or _MCU_CONFIGURED_RE.match(line)):
+            return False
+        self.mcu_lines.append((line, line_number))
+        return True
+
+
+def _parse_chunk(log_file_path: str, start: int, end: int) -> Tuple[int, _ChunkParser]:
+    """Parse one newline-aligned byte range of a log in a worker process."""
+    chunk = _ChunkParser(log_file_path)
+    with chunk._map_log() as mm:
+        line_count = chunk._parse_buffer(mm, start, end)
+    return line_count, chunk
+
+
 def main():
     parser = argparse.ArgumentParser(description='Analyze Klipper log files and provide insights')
     parser.add_argument('log_file', help='Path to the Klipper log file')
@@ -464,6 +721,7 @@ def main():
     parser.add_argument('--extract-stats', help='Extract stats lines to specified file')
     parser.add_argument('--no-plots', action='store_true', help='Skip generating plots')
     parser.add_argument('--report-only', action='store_true', help='Generate only text report')
+    parser.add_argument('--jobs', '-j', type=int, default=1, help='Number of processes used to parse the log')
     
     args = parser.parse_args()
     
@@ -471,7 +729,7 @@ def main():
     analyzer = KlipperLogAnalyzer(args.log_file)
     
     # Parse the log file
-    analyzer.parse_log()
+    analyzer.parse_log(jobs=args.jobs)
     
     if args.extract_stats:
         analyzer.extract_stats_to_file(args.extract_stats)